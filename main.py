@@ -12,9 +12,6 @@ from typing import TypeAlias, Any
 from modules.misc.config import load_config
 
 from modules.misc.messages import print_cu_rocket
-from modules.serial.serial_manager import SerialManager
-from modules.telemetry.telemetry import Telemetry
-from modules.websocket.websocket import WebSocketHandler
 from modules.misc.cli import parser
 
 JSON: TypeAlias = dict[str, Any]
@@ -50,6 +47,12 @@ logger = logging.getLogger(__name__)
 
 
 def main():
+    # The process modules pull in pyserial and Tornado, so they are only imported once the ground station actually
+    # starts (and not when the CLI just prints its help and exits)
+    from modules.serial.serial_manager import SerialManager
+    from modules.telemetry.telemetry import Telemetry
+    from modules.websocket.websocket import WebSocketHandler
+
     # Set up queues
     serial_status: Queue[str] = mp.Queue()  # type: ignore
     ws_commands: Queue[str] = mp.Queue()  # type: ignore
@@ -5,6 +5,7 @@ See the command data sheet for more information:
 https://ww1.microchip.com/downloads/en/DeviceDoc/RN2483-LoRa-Technology-Module-Command-Reference-User-Guide-DS40001784G.pdf
 """
 
+from string import hexdigits
 from typing import Optional
 from serial import Serial, EIGHTBITS, PARITY_NONE, SerialException
 from modules.misc.config import RadioParameters
@@ -182,14 +183,12 @@ class RN2483Radio:
         if not self._set_rx_mode():
             return None
 
-        message = str(self.serial.readline())[10:-5]  # Trim off reception indicator
+        message = str(self.serial.readline())[10:-5].strip()  # Trim off reception indicator and its padding
 
-        # Check if message is in hex
-        try:
-            int(message, 16)
+        # Check if message is in hex without converting the whole message into an integer
+        if message and not message.strip(hexdigits):
             return message
-        except ValueError:
-            return None
+        return None
 
     def signal_report(self) -> int:
         """
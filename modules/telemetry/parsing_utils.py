@@ -4,6 +4,8 @@ import logging
 
 
 from modules.telemetry.v1.block import (
+    PACKET_HEADER_STRUCT,
+    BLOCK_HEADER_STRUCT,
     PacketHeader,
     BlockHeader,
     DeviceAddress,
@@ -15,6 +17,9 @@ from modules.misc.config import Config
 
 MIN_SUPPORTED_VERSION: int = 1
 MAX_SUPPORTED_VERSION: int = 1
+GROUND_STATION_DESTINATIONS: frozenset[DeviceAddress] = frozenset(
+    {DeviceAddress.GROUND_STATION, DeviceAddress.MULTICAST}
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,111 +54,125 @@ def parse_rn2483_transmission(data: str, config: Config) -> Optional[ParsedTrans
 
     # Extract the packet header
     data = data.strip()  # Sometimes some extra whitespace
-    logger.debug(f"Full data string: {data}")
+    logger.debug("Full data string: %s", data)
     # TODO Make a generic abstract packet header class to encompass V1 packet header, etc
 
+    # Decode the whole packet once and slice views into it rather than re-decoding hex for every header and block
+    try:
+        packet = memoryview(bytes.fromhex(data))
+    except ValueError:
+        logger.error("Packet %s is not valid hex, skipping packet", data)
+        return
+
+    if len(packet) < PACKET_HEADER_STRUCT.size:
+        logger.error("Packet %s is too short to contain a packet header, skipping packet", data)
+        return
+
     # Catch unsupported encoding versions by skipping packet
     try:
-        pkt_hdr = PacketHeader.from_hex(data[:32])
+        pkt_hdr = PacketHeader.from_bytes(packet)
     except UnsupportedEncodingVersionError as e:
-        logger.error(f"{e}, skipping packet")
+        logger.error("%s, skipping packet", e)
         return
 
     # We can keep unauthorized callsigns but we'll log them as warnings
     from_approved_callsign(pkt_hdr, config.approved_callsigns)
 
     if len(pkt_hdr) <= 32:  # If this packet nothing more than just the header
-        logger.debug(f"{pkt_hdr}")
+        logger.debug("%s", pkt_hdr)
 
-    blocks = data[32:]  # Remove the packet header
+    offset = PACKET_HEADER_STRUCT.size  # Skip the packet header
 
     # Parse through all blocks
-    while blocks != "":
-        # Parse block header
-        logger.debug(f"Blocks: {blocks}")
-        logger.debug(f"Block header: {blocks[:8]}")
+    while offset < len(packet):
+        # Check explicitly that a full block header remains instead of letting a truncated one fail to parse
+        if len(packet) - offset < BLOCK_HEADER_STRUCT.size:
+            logger.error("Truncated block header %s, skipping remaining blocks", packet[offset:].hex())
+            break
 
         # Catch invalid block headers field values by skipping packet
         try:
-            block_header = BlockHeader.from_hex(blocks[:8])
+            block_header = BlockHeader.from_bytes(packet[offset:])
         except InvalidHeaderFieldValueError as e:
-            logger.error(f"{e}, skipping packet")
+            logger.error("%s, skipping packet", e)
             return
 
         # Select block contents
-        block_len = len(block_header) * 2  # Convert length in bytes to length in hex symbols
-        block_contents = blocks[8:block_len]
-        logger.debug(f"Block info: {block_header}")
+        block_end = offset + len(block_header)
+        if block_end > len(packet):
+            logger.error("Block length of %d bytes exceeds remaining packet data, skipping block", len(block_header))
+            break
+        block_contents = packet[offset + BLOCK_HEADER_STRUCT.size : block_end]
+        logger.debug("Block info: %s", block_header)
 
         # Check if message is destined for ground station for processing
-        if block_header.destination in [DeviceAddress.GROUND_STATION, DeviceAddress.MULTICAST]:
+        if block_header.destination in GROUND_STATION_DESTINATIONS:
             cur_block = parse_radio_block(pkt_hdr.version, block_header, block_contents)
             if cur_block:
                 parsed_blocks.append(cur_block)  # Append parsed block to list
         else:
             logger.warning("Invalid destination address")
 
-        # Remove the data we processed from the whole set, and move onto the next data block
-        blocks = blocks[block_len:]
+        # Move onto the next data block
+        offset = block_end
     return ParsedTransmission(pkt_hdr, parsed_blocks)
 
 
 def from_approved_callsign(pkt_hdr: PacketHeader, approved_callsigns: dict[str, str]) -> bool:
     """Checks whether the call sign is recognized"""
 
-    # Ensure packet is from an approved call sign
-    if pkt_hdr.callsign in approved_callsigns:
-        logger.debug(f"Incoming packet from {pkt_hdr.callsign} ({approved_callsigns.get(pkt_hdr.callsign)})")
-    else:
-        logger.warning(f"Incoming packet from unauthorized call sign {pkt_hdr.callsign}")
+    # Ensure packet is from an approved call sign, looking the call sign up only once
+    operator = approved_callsigns.get(pkt_hdr.callsign)
+    if operator is None:
+        logger.warning("Incoming packet from unauthorized call sign %s", pkt_hdr.callsign)
         return False
 
+    logger.debug("Incoming packet from %s (%s)", pkt_hdr.callsign, operator)
     return True
 
 
-def parse_radio_block(pkt_version: int, block_header: BlockHeader, hex_block_contents: str) -> Optional[ParsedBlock]:
+def parse_radio_block(
+    pkt_version: int, block_header: BlockHeader, block_contents: bytes | memoryview
+) -> Optional[ParsedBlock]:
     """
-    Parses telemetry payload blocks from either parsed packets or stored replays. Block contents are a hex string.
+    Parses telemetry payload blocks from either parsed packets or stored replays. Block contents are the raw bytes
+    following the block header, either as bytes or as a view into the packet they came from.
     """
 
-    # Working with hex strings until this point.
-    # Hex/Bytes Demarcation point
-    logger.debug(
-        f"Parsing v{pkt_version} type {block_header.message_type} subtype {block_header.message_subtype} contents: \
-            {hex_block_contents}"
-    )
-    block_bytes: bytes = bytes.fromhex(hex_block_contents)
-
-    # Convert message subtype string to enum
-    try:
-        block_subtype = v1db.DataBlockSubtype(block_header.message_subtype)
-    except ValueError:
-        logger.error(f"Invalid data block subtype {block_header.message_subtype}!")
-        return
+    # Only hex-encode the contents when they will actually be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Parsing v%d type %s subtype %s contents: %s",
+            pkt_version,
+            block_header.message_type,
+            block_header.message_subtype,
+            block_contents.hex(),
+        )
 
-    # Use the appropriate parser for the block subtype enum
+    # Use the appropriate parser for the block subtype
     try:
         # TODO Make an interface to support multiple v1/v2/v3 objects
-        block_contents = v1db.DataBlock.parse(block_subtype, block_bytes)
+        data_block = v1db.DataBlock.parse(block_header.message_subtype, block_contents)
     except NotImplementedError:
         logger.warning(
-            f"Block parsing for type {block_header.message_type}, with subtype {block_header.message_subtype} not \
-            implemented!"
+            "Block parsing for type %s, with subtype %s not implemented!",
+            block_header.message_type,
+            block_header.message_subtype,
         )
         return
     except v1db.DataBlockException as e:
         logger.error(e)
-        logger.error(f"Block header: {block_header}")
-        logger.error(f"Block contents: {hex_block_contents}")
+        logger.error("Block header: %s", block_header)
+        logger.error("Block contents: %s", block_contents.hex())
         return
 
-    block_name = block_subtype.name.lower()
+    block_name = block_header.message_subtype.name.lower()
 
-    logger.debug(str(block_contents))
+    logger.debug("%s", data_block)
 
     # TODO fix at some point
     # if block == DataBlockSubtype.STATUS:
     #     self.status.rocket = jsp.RocketData.from_data_block(block)
     #     return
 
-    return ParsedBlock(block_name, block_header, dict(block_contents))  # type: ignore
+    return ParsedBlock(block_name, block_header, dict(data_block))  # type: ignore
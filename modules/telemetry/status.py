@@ -1,10 +1,41 @@
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any
+import os
 
 # Constants
 MISSIONS_DIR: str = "missions"
 MISSION_EXTENSION: str = "mission"
+READ_CHUNK_SIZE: int = 1 << 20  # Bytes read at a time when scanning mission files
+
+
+# Helper functions
+def count_lines(filepath: Path) -> int:
+    """Returns the number of lines in a file, scanning it as raw bytes in large chunks instead of decoding each line."""
+
+    lines = 0
+    last_chunk = b""
+    with open(filepath, "rb") as file:
+        for chunk in iter(partial(file.read, READ_CHUNK_SIZE), b""):
+            lines += chunk.count(b"\n")
+            last_chunk = chunk
+
+    # A final line with no trailing newline is still a line
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        lines += 1
+    return lines
+
+
+@lru_cache(maxsize=256)
+def count_mission_lines(filepath: Path, mtime_ns: int, size: int) -> int:
+    """
+    Returns the number of lines in a mission file. The modification time and size are part of the cache key, so
+    unchanged files are not re-read each time the mission list is refreshed, while files that are still being
+    recorded to are.
+    """
+    return count_lines(filepath)
 
 
 # Helper classes
@@ -25,7 +56,7 @@ class ReplayState(IntEnum):
     FINISHED = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class MissionEntry:
     """Represents an available mission for replay."""
 
@@ -35,10 +66,12 @@ class MissionEntry:
     version: int = 1
     valid: bool = False
 
+    def to_dict(self) -> dict[str, str | int]:
+        """Returns the JSON representation of the mission entry."""
+        return {"name": self.name, "length": self.length, "version": self.version}
+
     def __iter__(self):
-        yield "name", self.name
-        yield "length", self.length
-        yield "version", self.version
+        yield from self.to_dict().items()
 
     def __len__(self) -> int:
         return self.length
@@ -48,17 +81,21 @@ class MissionEntry:
 
 
 # Status packet classes
-@dataclass
+@dataclass(slots=True)
 class SerialData:
     """The serial data packet for the telemetry process."""
 
     available_ports: list[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, list[str]]:
+        """Returns the JSON representation of the serial data."""
+        return {"available_ports": self.available_ports}
+
     def __iter__(self):
-        yield "available_ports", self.available_ports
+        yield from self.to_dict().items()
 
 
-@dataclass
+@dataclass(slots=True)
 class RN2483RadioData:
     """The RN2483 radio data packet for the telemetry process."""
 
@@ -66,13 +103,15 @@ class RN2483RadioData:
     connected_port: str = ""
     snr: int = 0  # TODO SET SNR
 
+    def to_dict(self) -> dict[str, bool | str | int]:
+        """Returns the JSON representation of the RN2483 radio data."""
+        return {"connected": self.connected, "connected_port": self.connected_port, "snr": self.snr}
+
     def __iter__(self):
-        yield "connected", self.connected,
-        yield "connected_port", self.connected_port
-        yield "snr", self.snr
+        yield from self.to_dict().items()
 
 
-@dataclass
+@dataclass(slots=True)
 class MissionData:
     """The mission data packet for the telemetry process."""
 
@@ -82,15 +121,16 @@ class MissionData:
     recording: bool = False
     last_mission_time: int = -1
 
+    def to_dict(self) -> dict[str, str | int | bool]:
+        """Returns the JSON representation of the mission data."""
+        return {"name": self.name, "epoch": self.epoch, "state": self.state.value, "recording": self.recording}
+
     def __iter__(self):
-        yield "name", self.name,
-        yield "epoch", self.epoch,
-        yield "state", self.state.value,
-        yield "recording", self.recording
+        yield from self.to_dict().items()
 
 
 # Replay packet class
-@dataclass
+@dataclass(slots=True)
 class ReplayData:
     """The replay data packet for the telemetry process."""
 
@@ -108,24 +148,39 @@ class ReplayData:
         """Gets the available mission recordings from the mission folder."""
 
         # TODO change this so that mission_extension and directory are not defined in multiple files
-        self.mission_files_list = [file for file in missions_dir.glob(f"*.{MISSION_EXTENSION}") if file.is_file()]
+        # Scan the directory once, reusing each entry's cached file type and stat instead of querying every path again
+        mission_entries: list[tuple[Path, os.stat_result]] = []
+        try:
+            with os.scandir(missions_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(f".{MISSION_EXTENSION}") and entry.is_file():
+                        mission_entries.append((Path(entry.path), entry.stat()))
+        except FileNotFoundError:
+            pass
+
+        self.mission_files_list = [mission_file for mission_file, _ in mission_entries]
 
         # Check each file to output its misc details
         self.mission_list = []
-        for mission_file in self.mission_files_list:
+        for mission_file, file_stat in mission_entries:
+            length = count_mission_lines(mission_file, file_stat.st_mtime_ns, file_stat.st_size)
             self.mission_list.append(
-                MissionEntry(
-                    name=mission_file.stem, length=sum(1 for _ in open(mission_file)), filepath=mission_file, version=1
-                )
+                MissionEntry(name=mission_file.stem, length=length, filepath=mission_file, version=1)
             )
 
+    def to_dict(self) -> dict[str, ReplayState | float | list[dict[str, str | int]]]:
+        """Returns the JSON representation of the replay data."""
+        return {
+            "state": self.state,
+            "speed": self.speed,
+            "mission_list": [entry.to_dict() for entry in self.mission_list],
+        }
+
     def __iter__(self):
-        yield "state", self.state
-        yield "speed", self.speed,
-        yield "mission_list", [dict(e) for e in self.mission_list]
+        yield from self.to_dict().items()
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryStatus:
     """The status data packet for the telemetry process."""
 
@@ -134,8 +189,14 @@ class TelemetryStatus:
     rn2483_radio: RN2483RadioData = field(default_factory=RN2483RadioData)
     replay: ReplayData = field(default_factory=ReplayData)
 
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Returns the JSON representation of the telemetry status, building each section directly."""
+        return {
+            "mission": self.mission.to_dict(),
+            "serial": self.serial.to_dict(),
+            "rn2483_radio": self.rn2483_radio.to_dict(),
+            "replay": self.replay.to_dict(),
+        }
+
     def __iter__(self):
-        yield "mission", dict(self.mission),
-        yield "serial", dict(self.serial),
-        yield "rn2483_radio", dict(self.rn2483_radio),
-        yield "replay", dict(self.replay),
+        yield from self.to_dict().items()
@@ -135,7 +135,7 @@ class Telemetry:
             "org": self.config.organization,
             "rocket": self.config.rocket_name,
             "version": self.version,
-            "status": dict(self.status),
+            "status": self.status.to_dict(),
             "telemetry": dict(self.telemetry_data),
         }
         self.telemetry_json_output.put(websocket_response)
@@ -1,15 +1,22 @@
 # Contains universal block utilities for version 1 of the radio packet format
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import lru_cache
 from typing import Self, Optional
 import struct
 import logging
+import sys
 
 from modules.telemetry.v1.data_block import DataBlockSubtype
 
 MIN_SUPPORTED_VERSION: int = 1
 MAX_SUPPORTED_VERSION: int = 1
 
+# Packet header: call sign (9 bytes), length, version, source address, packet number
+PACKET_HEADER_STRUCT: struct.Struct = struct.Struct("<9sBBBI")
+# Block header: length, message type, message subtype, destination address
+BLOCK_HEADER_STRUCT: struct.Struct = struct.Struct("<BBBB")
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -40,6 +47,13 @@ class DeviceAddress(IntEnum):
                 return "MULTICAST"
 
 
+# Lookup tables from raw header field values to enum members, built once so parsing avoids the cost of calling the
+# enum constructor for every field
+BLOCK_TYPE_MAP: dict[int, BlockType] = {member.value: member for member in BlockType}
+DATA_BLOCK_SUBTYPE_MAP: dict[int, DataBlockSubtype] = {member.value: member for member in DataBlockSubtype}
+DEVICE_ADDRESS_MAP: dict[int, DeviceAddress] = {member.value: member for member in DeviceAddress}
+
+
 class UnsupportedEncodingVersionError(Exception):
     """Exception raised when the encoding version is not supported."""
 
@@ -57,7 +71,28 @@ class InvalidHeaderFieldValueError(Exception):
         super().__init__(f"Invalid {cls_name} field: {val} is not a valid value for {field}")
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def decode_callsign(raw_callsign: bytes) -> tuple[str, str]:
+    """
+    Decodes the call sign and call zone from the raw call sign field of a packet header. A mission only ever sees a
+    few distinct call signs, so results are cached.
+    Returns:
+        The call sign and the call zone.
+    """
+
+    # Rearranges if call zone (W5/VE3LWN) is first
+    amateur_radio = raw_callsign.decode("utf-8").strip("\x00").upper()
+    ham_call_sign = amateur_radio[:6]
+    ham_call_zone = amateur_radio[6:]
+    if ham_call_sign.find("/") != -1:
+        ham_call_sign = amateur_radio.split("/")[1]
+        ham_call_zone = amateur_radio.split("/")[0]
+
+    # Interned so every header from the same station shares one call sign string, whatever raw form it arrived in
+    return sys.intern(ham_call_sign.strip("/")), sys.intern(ham_call_zone.strip("/"))
+
+
+@dataclass(slots=True)
 class PacketHeader:
     """Represents a V1 packet header."""
 
@@ -75,27 +110,31 @@ class PacketHeader:
         Returns:
             A newly constructed packet header object.
         """
-        header = bin(int(payload, 16))[2:]
-
-        # Decodes the call sign/call zone from packet header
-        # Rearranges if call zone (W5/VE3LWN) is first
-        amateur_radio = bytes.fromhex(payload[:18]).decode("utf-8").strip("\x00").upper()
-        ham_call_sign = amateur_radio[:6]
-        ham_call_zone = amateur_radio[6:]
-        if ham_call_sign.find("/") != -1:
-            ham_call_sign = amateur_radio.split("/")[1]
-            ham_call_zone = amateur_radio.split("/")[0]
+        return cls._from_fields(*PACKET_HEADER_STRUCT.unpack(bytes.fromhex(payload)))
 
-        callsign = ham_call_sign.strip("/")
-        callzone = ham_call_zone.strip("/")
-        length = (int(header[71:79], 2) + 1) * 4
-        version = int(header[79:87], 2)
-        try:
-            src_addr = DeviceAddress(int(header[87:95], 2))
-        except ValueError as e:
-            raise InvalidHeaderFieldValueError(cls.__name__, e.args[0].split()[0], e.args[0].split()[-1])
+    @classmethod
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
+        """
+        Constructs a new packet header from the first PACKET_HEADER_STRUCT.size bytes of a payload.
+        Returns:
+            A newly constructed packet header object.
+        """
+        return cls._from_fields(*PACKET_HEADER_STRUCT.unpack_from(payload))
 
-        packet_num = struct.unpack(">I", struct.pack("<I", int(header[95:127], 2)))[0]
+    @classmethod
+    def _from_fields(
+        cls, raw_callsign: bytes, raw_length: int, version: int, raw_src_addr: int, packet_num: int
+    ) -> Self:
+        """
+        Constructs a new packet header from its raw field values.
+        Returns:
+            A newly constructed packet header object.
+        """
+        callsign, callzone = decode_callsign(raw_callsign)
+        length = (raw_length + 1) * 4
+        src_addr = DEVICE_ADDRESS_MAP.get(raw_src_addr)
+        if src_addr is None:
+            raise InvalidHeaderFieldValueError(cls.__name__, str(raw_src_addr), DeviceAddress.__name__)
 
         if version < MIN_SUPPORTED_VERSION or version > MAX_SUPPORTED_VERSION:
             raise UnsupportedEncodingVersionError(version)
@@ -110,9 +149,12 @@ class PacketHeader:
         return self.length
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BlockHeader:
-    """Represents a V1 header for a telemetry block."""
+    """
+    Represents a V1 header for a telemetry block.
+    Block headers are immutable so that parsed headers can be cached and shared between packets.
+    """
 
     length: int
     message_type: int
@@ -124,19 +166,42 @@ class BlockHeader:
         """
         Constructs a block header object from a hex payload.
         Returns:
-            A newly constructed block header.
+            A block header.
+        """
+        return cls._from_fields(*BLOCK_HEADER_STRUCT.unpack(bytes.fromhex(payload)))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
+        """
+        Constructs a block header object from the first BLOCK_HEADER_STRUCT.size bytes of a payload.
+        Returns:
+            A block header.
+        """
+        return cls._from_fields(*BLOCK_HEADER_STRUCT.unpack_from(payload))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _from_fields(cls, raw_length: int, raw_type: int, raw_subtype: int, raw_destination: int) -> Self:
         """
+        Constructs a block header object from its raw field values. Only a handful of distinct block headers appear
+        in a mission, so results are cached and repeated headers return the same object.
+        Returns:
+            A block header.
+        """
+
+        length = (raw_length + 1) * 4
 
-        unpacked_header = struct.unpack("<BBBB", bytes.fromhex(payload))
+        message_type = BLOCK_TYPE_MAP.get(raw_type)
+        if message_type is None:
+            raise InvalidHeaderFieldValueError(cls.__name__, str(raw_type), BlockType.__name__)
 
-        length = int(((unpacked_header[0]) + 1) * 4)
+        message_subtype = DATA_BLOCK_SUBTYPE_MAP.get(raw_subtype)
+        if message_subtype is None:
+            raise InvalidHeaderFieldValueError(cls.__name__, str(raw_subtype), DataBlockSubtype.__name__)
 
-        try:
-            message_type = BlockType(unpacked_header[1])
-            message_subtype = DataBlockSubtype(unpacked_header[2])
-            destination = DeviceAddress(unpacked_header[3])
-        except ValueError as e:
-            raise InvalidHeaderFieldValueError(cls.__name__, e.args[0].split()[0], e.args[0].split()[-1])
+        destination = DEVICE_ADDRESS_MAP.get(raw_destination)
+        if destination is None:
+            raise InvalidHeaderFieldValueError(cls.__name__, str(raw_destination), DeviceAddress.__name__)
 
         return cls(length, message_type, message_subtype, destination)
 
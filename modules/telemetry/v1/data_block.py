@@ -3,10 +3,21 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Self, Type
 from enum import IntEnum
+from math import hypot
 import struct
 
 from modules.misc.converter import metres_to_feet, milli_degrees_to_celsius, pascals_to_psi
 
+# Data block payload layouts, each starting with the mission time in milliseconds
+MISSION_TIME_STRUCT: struct.Struct = struct.Struct("<I")
+ALTITUDE_STRUCT: struct.Struct = struct.Struct("<Ii")
+TEMPERATURE_STRUCT: struct.Struct = struct.Struct("<Ii")
+PRESSURE_STRUCT: struct.Struct = struct.Struct("<II")
+THREE_AXIS_STRUCT: struct.Struct = struct.Struct("<Ihhhh")  # x, y, z and padding
+HUMIDITY_STRUCT: struct.Struct = struct.Struct("<II")
+COORDINATES_STRUCT: struct.Struct = struct.Struct("<Iii")
+VOLTAGE_STRUCT: struct.Struct = struct.Struct("<IHh")
+
 
 class DataBlockException(Exception):
     """Exception raised when an error occurs while parsing a data block."""
@@ -61,13 +72,15 @@ class DataBlockSubtype(IntEnum):
 class DataBlock(ABC):
     """The abstract base interface for all data blocks."""
 
+    __slots__ = ("mission_time",)
+
     def __init__(self, mission_time: int) -> None:
         """Constructs a data block with the given mission time."""
         self.mission_time: int = mission_time
 
     @classmethod
     @abstractmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a data block from bytes.
         Returns:
@@ -95,23 +108,9 @@ class DataBlock(ABC):
         pass
 
     @staticmethod
-    def parse(block_subtype: DataBlockSubtype, payload: bytes) -> DataBlock:
+    def parse(block_subtype: DataBlockSubtype, payload: bytes | memoryview) -> DataBlock:
         """Unmarshal a bytes object to appropriate block class."""
 
-        SUBTYPE_CLASSES: dict[DataBlockSubtype, Type[DataBlock]] = {
-            DataBlockSubtype.DEBUG_MESSAGE: DebugMessageDB,
-            DataBlockSubtype.ALTITUDE_SEA_LEVEL: AltitudeSeaLevelDB,
-            DataBlockSubtype.ALTITUDE_LAUNCH_LEVEL: AltitudeLaunchLevelDB,
-            DataBlockSubtype.TEMPERATURE: TemperatureDB,
-            DataBlockSubtype.PRESSURE: PressureDB,
-            DataBlockSubtype.LIN_ACCEL_REL: RelativeLinearAccelerationDB,
-            DataBlockSubtype.LIN_ACCEL_ABS: AbsoluteLinearAccelerationDB,
-            DataBlockSubtype.ANGULAR_VELOCITY: AngularVelocityDB,
-            DataBlockSubtype.HUMIDITY: HumidityDB,
-            DataBlockSubtype.COORDINATES: CoordinatesDB,
-            DataBlockSubtype.VOLTAGE: VoltageDB,
-        }
-
         subtype = SUBTYPE_CLASSES.get(block_subtype)
 
         if subtype is None:
@@ -128,19 +127,21 @@ class DataBlock(ABC):
 class DebugMessageDB(DataBlock):
     """Represents a debug message data block."""
 
+    __slots__ = ("message",)
+
     def __init__(self, mission_time: int, message: str) -> None:
         super().__init__(mission_time)
         self.message: str = message
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a debug message data block from bytes.
         Returns:
             A debug message data block.
         """
-        mission_time = struct.unpack("<I", payload[:4])[0]
-        message = payload[4:].decode("utf-8")
+        mission_time = MISSION_TIME_STRUCT.unpack_from(payload)[0]
+        message = str(payload[MISSION_TIME_STRUCT.size :], "utf-8")
         return cls(mission_time, message)
 
     def __len__(self) -> int:
@@ -165,6 +166,8 @@ class DebugMessageDB(DataBlock):
 class AltitudeDB(DataBlock):
     """Represents an altitude data block."""
 
+    __slots__ = ("altitude",)
+
     def __init__(self, mission_time: int, altitude: int) -> None:
         super().__init__(mission_time)
         self.altitude = altitude
@@ -178,14 +181,14 @@ class AltitudeDB(DataBlock):
         return 16
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a data block from bytes.
         Returns:
             An altitude data block.
         """
 
-        parts = struct.unpack("<Ii", payload)
+        parts = ALTITUDE_STRUCT.unpack(payload)
         return cls(parts[0], parts[1] / 1000)  # Altitude is sent in mm
 
     def to_bytes(self) -> bytes:
@@ -202,6 +205,8 @@ class AltitudeDB(DataBlock):
 class AltitudeSeaLevelDB(AltitudeDB):
     """Represents an altitude data block with measurements relative to sea level."""
 
+    __slots__ = ()
+
     def __init__(self, mission_time: int, altitude: int) -> None:
         super().__init__(mission_time, altitude)
 
@@ -209,6 +214,8 @@ class AltitudeSeaLevelDB(AltitudeDB):
 class AltitudeLaunchLevelDB(AltitudeDB):
     """Represents an altitude data block with measurements relative to launch level."""
 
+    __slots__ = ()
+
     def __init__(self, mission_time: int, altitude: int) -> None:
         super().__init__(mission_time, altitude)
 
@@ -216,18 +223,20 @@ class AltitudeLaunchLevelDB(AltitudeDB):
 class TemperatureDB(DataBlock):
     """Represents a temperature data block."""
 
+    __slots__ = ("temperature",)
+
     def __init__(self, mission_time: int, temperature: int) -> None:
         super().__init__(mission_time)
         self.temperature: int = temperature
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a temperature data block from bytes.
         Returns:
             A temperature data block.
         """
-        parts = struct.unpack("<Ii", payload)
+        parts = TEMPERATURE_STRUCT.unpack(payload)
         return cls(parts[0], parts[1])
 
     def __len__(self) -> int:
@@ -253,6 +262,8 @@ class TemperatureDB(DataBlock):
 class PressureDB(DataBlock):
     """Represents a pressure data block."""
 
+    __slots__ = ("pressure",)
+
     def __init__(self, mission_time: int, pressure: int) -> None:
         """
         Constructs a pressure data block.
@@ -266,13 +277,13 @@ class PressureDB(DataBlock):
         self.pressure: int = pressure
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a pressure data block from bytes.
         Returns:
             A pressure data block.
         """
-        parts = struct.unpack("<II", payload)
+        parts = PRESSURE_STRUCT.unpack(payload)
         return cls(parts[0], parts[1])
 
     def __len__(self) -> int:
@@ -294,6 +305,8 @@ class PressureDB(DataBlock):
 class LinearAccelerationDB(DataBlock):
     """Represents a linear acceleration data block"""
 
+    __slots__ = ("x_axis", "y_axis", "z_axis", "magnitude")
+
     def __init__(self, mission_time: int, x_axis: int, y_axis: int, z_axis: int) -> None:
         """
         Constructs a linear acceleration data block.
@@ -309,16 +322,16 @@ class LinearAccelerationDB(DataBlock):
         self.x_axis: float = x_axis
         self.y_axis: float = y_axis
         self.z_axis: float = z_axis
-        self.magnitude: float = round((abs(x_axis) ** 2 + abs(y_axis) ** 2 + abs(z_axis) ** 2) ** 0.5, 2)
+        self.magnitude: float = round(hypot(x_axis, y_axis, z_axis), 2)
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a linear acceleration data block from bytes.
         Returns:
             A linear acceleration data block.
         """
-        parts = struct.unpack("<Ihhhh", payload)
+        parts = THREE_AXIS_STRUCT.unpack(payload)
         return cls(parts[0], parts[1] / 100, parts[2] / 100, parts[3] / 100)
 
     def __len__(self) -> int:
@@ -341,6 +354,8 @@ class LinearAccelerationDB(DataBlock):
 class RelativeLinearAccelerationDB(LinearAccelerationDB):
     """Represents a linear acceleration data block with measurements relative to the rocket's position."""
 
+    __slots__ = ()
+
     def __init__(self, mission_time: int, x_axis: int, y_axis: int, z_axis: int) -> None:
         super().__init__(mission_time, x_axis, y_axis, z_axis)
 
@@ -348,6 +363,8 @@ class RelativeLinearAccelerationDB(LinearAccelerationDB):
 class AbsoluteLinearAccelerationDB(LinearAccelerationDB):
     """Represents a linear acceleration data block with measurements relative to ground."""
 
+    __slots__ = ()
+
     def __init__(self, mission_time: int, x_axis: int, y_axis: int, z_axis: int) -> None:
         super().__init__(mission_time, x_axis, y_axis, z_axis)
 
@@ -355,6 +372,8 @@ class AbsoluteLinearAccelerationDB(LinearAccelerationDB):
 class AngularVelocityDB(DataBlock):
     """Represents an angular velocity data block"""
 
+    __slots__ = ("x_axis", "y_axis", "z_axis", "magnitude")
+
     def __init__(self, mission_time: int, x_axis: int, y_axis: int, z_axis: int) -> None:
         """
         Constructus an angular velocity data block.
@@ -370,16 +389,16 @@ class AngularVelocityDB(DataBlock):
         self.x_axis: float = x_axis
         self.y_axis: float = y_axis
         self.z_axis: float = z_axis
-        self.magnitude: float = round((abs(x_axis) ** 2 + abs(y_axis) ** 2 + abs(z_axis) ** 2) ** 0.5, 2)
+        self.magnitude: float = round(hypot(x_axis, y_axis, z_axis), 2)
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs an angular velocity data block from bytes.
         Returns:
             An angular velocity data block.
         """
-        parts = struct.unpack("<Ihhhh", payload)
+        parts = THREE_AXIS_STRUCT.unpack(payload)
         return cls(parts[0], parts[1] / 10, parts[2] / 10, parts[3] / 10)
 
     def __len__(self) -> int:
@@ -402,6 +421,8 @@ class AngularVelocityDB(DataBlock):
 class HumidityDB(DataBlock):
     """Represents a humidity data block."""
 
+    __slots__ = ("humidity",)
+
     def __init__(self, mission_time: int, humidity: int) -> None:
         """
         Constructs a humidity data block.
@@ -415,13 +436,13 @@ class HumidityDB(DataBlock):
         self.humidity: int = humidity
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a humidity data block from bytes.
         Returns:
             A humidity data block.
         """
-        parts = struct.unpack("<II", payload)
+        parts = HUMIDITY_STRUCT.unpack(payload)
         return cls(parts[0], parts[1])
 
     def __len__(self) -> int:
@@ -443,6 +464,8 @@ class HumidityDB(DataBlock):
 class CoordinatesDB(DataBlock):
     """Represents a coordinates data block"""
 
+    __slots__ = ("latitude", "longitude")
+
     def __init__(self, mission_time: int, latitude: int, longitude: int) -> None:
         """
         Constructs a coordinates data block.
@@ -457,13 +480,13 @@ class CoordinatesDB(DataBlock):
         self.longitude: float = longitude
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a coordinates data block from bytes.
         Returns:
             A coordinates data block.
         """
-        parts = struct.unpack("<Iii", payload)
+        parts = COORDINATES_STRUCT.unpack(payload)
         return cls(parts[0], parts[1] / 1e7, parts[2] / 1e7)
 
     def __len__(self) -> int:
@@ -487,6 +510,8 @@ class CoordinatesDB(DataBlock):
 class VoltageDB(DataBlock):
     """Represents a voltage data block"""
 
+    __slots__ = ("id", "voltage")
+
     def __init__(self, mission_time: int, id: int, voltage: int) -> None:
         """
         Constructus a voltage data block.
@@ -501,13 +526,13 @@ class VoltageDB(DataBlock):
         self.voltage: int = voltage
 
     @classmethod
-    def from_bytes(cls, payload: bytes) -> Self:
+    def from_bytes(cls, payload: bytes | memoryview) -> Self:
         """
         Constructs a voltage data block from bytes.
         Returns:
             A voltage data block.
         """
-        parts = struct.unpack("<IHh", payload)
+        parts = VOLTAGE_STRUCT.unpack(payload)
         return cls(parts[0], parts[1], parts[2])
 
     def __len__(self) -> int:
@@ -527,3 +552,19 @@ class VoltageDB(DataBlock):
         yield "mission_time", self.mission_time
         yield "id", self.id
         yield "voltage", self.voltage
+
+
+# Maps each data block subtype to the class that parses it; built once rather than on every call to DataBlock.parse
+SUBTYPE_CLASSES: dict[DataBlockSubtype, Type[DataBlock]] = {
+    DataBlockSubtype.DEBUG_MESSAGE: DebugMessageDB,
+    DataBlockSubtype.ALTITUDE_SEA_LEVEL: AltitudeSeaLevelDB,
+    DataBlockSubtype.ALTITUDE_LAUNCH_LEVEL: AltitudeLaunchLevelDB,
+    DataBlockSubtype.TEMPERATURE: TemperatureDB,
+    DataBlockSubtype.PRESSURE: PressureDB,
+    DataBlockSubtype.LIN_ACCEL_REL: RelativeLinearAccelerationDB,
+    DataBlockSubtype.LIN_ACCEL_ABS: AbsoluteLinearAccelerationDB,
+    DataBlockSubtype.ANGULAR_VELOCITY: AngularVelocityDB,
+    DataBlockSubtype.HUMIDITY: HumidityDB,
+    DataBlockSubtype.COORDINATES: CoordinatesDB,
+    DataBlockSubtype.VOLTAGE: VoltageDB,
+}
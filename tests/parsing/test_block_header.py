@@ -2,6 +2,7 @@
 
 # Imports
 import pytest
+import struct
 from modules.telemetry.v1.block import BlockHeader, InvalidHeaderFieldValueError
 
 
@@ -108,6 +109,12 @@ def test_parsing_header3(header3: str):
     assert hdr.destination == 0
 
 
+def test_parsing_header_cached(header1: str, header2: str):
+    """Ensure that parsing the same block header twice returns the same cached header."""
+    assert BlockHeader.from_hex(header1) is BlockHeader.from_hex(header1)
+    assert BlockHeader.from_hex(header1) is not BlockHeader.from_hex(header2)
+
+
 def test_parsing_header1_invalid_message_type(header1_invalid_message_type: str):
     """Ensure that parsing a block header with an invalid message type raises an error."""
     with pytest.raises(
@@ -131,3 +138,9 @@ def test_parsing_header1_invalid_destination(header1_invalid_destination: str):
         InvalidHeaderFieldValueError, match="Invalid BlockHeader field: 5 is not a valid value for DeviceAddress"
     ):
         _ = BlockHeader.from_hex(header1_invalid_destination)
+
+
+def test_parsing_header1_too_long(header1: str):
+    """Ensure that parsing a hex block header with trailing data raises an error instead of truncating it."""
+    with pytest.raises(struct.error):
+        _ = BlockHeader.from_hex(header1 + "00")
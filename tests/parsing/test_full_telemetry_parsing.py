@@ -8,8 +8,8 @@ from modules.telemetry.v1.block import (
     InvalidHeaderFieldValueError,
     UnsupportedEncodingVersionError,
 )
-from modules.telemetry.parsing_utils import parse_radio_block, from_approved_callsign
-from modules.misc.config import load_config
+from modules.telemetry.parsing_utils import parse_radio_block, from_approved_callsign, parse_rn2483_transmission
+from modules.misc.config import Config, load_config
 from modules.telemetry.v1.data_block import DataBlockSubtype
 
 # Fixtures and tests to ensure that parse_radio_block works as expected
@@ -39,11 +39,19 @@ def hex_block_contents() -> str:
     return "00000000f0c30000"
 
 
-def test_radio_block(pkt_version: int, block_header: BlockHeader, hex_block_contents: str) -> None:
+@pytest.fixture
+def block_contents(hex_block_contents: str) -> bytes:
+    """
+    returns the contents as bytes
+    """
+    return bytes.fromhex(hex_block_contents)
+
+
+def test_radio_block(pkt_version: int, block_header: BlockHeader, block_contents: bytes) -> None:
     """
     test a proper line on parse_radio_block
     """
-    prb = parse_radio_block(pkt_version, block_header, hex_block_contents)
+    prb = parse_radio_block(pkt_version, block_header, block_contents)
     assert prb is not None
     assert prb.block_header.length == 12
     assert prb.block_header.message_type == BlockType.DATA.value
@@ -61,7 +69,7 @@ def not_implemented_datablock_subtype() -> BlockHeader:
     return BlockHeader.from_hex("02000a00")
 
 
-def test_invalid_datablock_subtype(pkt_version: int, hex_block_contents: str):
+def test_invalid_datablock_subtype(pkt_version: int, block_contents: bytes):
     """
     test for random subtype ValueError
     """
@@ -69,25 +77,35 @@ def test_invalid_datablock_subtype(pkt_version: int, hex_block_contents: str):
     with pytest.raises(
         InvalidHeaderFieldValueError, match="Invalid BlockHeader field: 154 is not a valid value for DataBlockSubtype"
     ):
-        parse_radio_block(pkt_version, BlockHeader.from_hex("02009A00"), hex_block_contents)
+        parse_radio_block(pkt_version, BlockHeader.from_hex("02009A00"), block_contents)
+
 
+@pytest.fixture(scope="session")
+def config() -> Config:
+    """
+    returns the ground station config, loaded once per test session
+    """
+    return load_config("config.json")
 
-config = load_config("config.json")
 
 # Fixtures and tests to ensure that from_approved_callsign works as expected
 
 
 @pytest.fixture
-def approved_callsigns() -> dict[str, str]:
+def approved_callsigns(config: Config) -> dict[str, str]:
     return config.approved_callsigns
 
 
 @pytest.fixture
-def valid_packet_header() -> PacketHeader:
+def packet_header_hex() -> str:
+    """Returns a valid packet header from VA3INI."""
     # first 32 characters of a packet
-    hdr = "564133494e490000000c010137000000"
-    pkt_hdr = PacketHeader.from_hex(hdr)
-    return pkt_hdr
+    return "564133494e490000000c010137000000"
+
+
+@pytest.fixture
+def valid_packet_header(packet_header_hex: str) -> PacketHeader:
+    return PacketHeader.from_hex(packet_header_hex)
 
 
 @pytest.fixture
@@ -131,3 +149,38 @@ def test_is_invalid_hdr2(approved_callsigns: dict[str, str]) -> None:
 
     with pytest.raises(UnsupportedEncodingVersionError, match="Unsupported encoding version: 11"):
         PacketHeader.from_hex(hdr)
+
+
+# Fixtures and tests to ensure that parse_rn2483_transmission handles truncated packets as expected
+
+
+def test_full_transmission(config: Config, packet_header_hex: str, hex_block_contents: str) -> None:
+    """Test that a packet with one complete temperature block is parsed."""
+    transmission = parse_rn2483_transmission(packet_header_hex + "02000300" + hex_block_contents, config)
+
+    assert transmission is not None
+    assert len(transmission.blocks) == 1
+    assert transmission.blocks[0].block_name == "temperature"
+
+
+def test_truncated_block_header(config: Config, packet_header_hex: str, hex_block_contents: str) -> None:
+    """Test that a trailing partial block header is dropped while the complete blocks before it are kept."""
+    transmission = parse_rn2483_transmission(packet_header_hex + "02000300" + hex_block_contents + "020003", config)
+
+    assert transmission is not None
+    assert len(transmission.blocks) == 1
+
+
+def test_truncated_block_contents(config: Config, packet_header_hex: str, hex_block_contents: str) -> None:
+    """Test that a trailing block shorter than its header's length is dropped while earlier blocks are kept."""
+    transmission = parse_rn2483_transmission(
+        packet_header_hex + "02000300" + hex_block_contents + "02000300" + "00000000", config
+    )
+
+    assert transmission is not None
+    assert len(transmission.blocks) == 1
+
+
+def test_short_packet(config: Config) -> None:
+    """Test that data too short to hold a packet header is skipped instead of raising."""
+    assert parse_rn2483_transmission("0000", config) is None
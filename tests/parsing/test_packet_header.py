@@ -2,7 +2,8 @@
 __author__ = "Matteo Golin"
 
 import pytest
-from modules.telemetry.v1.block import PacketHeader, InvalidHeaderFieldValueError
+import struct
+from modules.telemetry.v1.block import PacketHeader, InvalidHeaderFieldValueError, decode_callsign
 
 
 @pytest.fixture
@@ -65,9 +66,20 @@ def test_devil_header(devil_header: str) -> None:
     assert hdr.packet_num == 2416312320
 
 
+def test_decode_callsign_zone_first() -> None:
+    """Test that a call zone written before the call sign is moved after it."""
+    assert decode_callsign(b"W5/VE3LWN") == ("VE3LWN", "W5")
+
+
 def test_linguini_header_invalid_src_addr(linguini_header_invalid_src_addr: str) -> None:
     """Test that the linguini packet header with an invalid src_addr raises an error."""
     with pytest.raises(
         InvalidHeaderFieldValueError, match="Invalid PacketHeader field: 2 is not a valid value for DeviceAddress"
     ):
         _ = PacketHeader.from_hex(linguini_header_invalid_src_addr)
+
+
+def test_linguini_header_too_long(linguini_header: str) -> None:
+    """Test that a hex packet header with trailing data raises an error instead of being truncated."""
+    with pytest.raises(struct.error):
+        _ = PacketHeader.from_hex(linguini_header + "00")
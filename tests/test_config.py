@@ -4,12 +4,12 @@ __author__ = "Matteo Golin"
 # Imports
 import pytest
 import json
-import os
+from pathlib import Path
 from modules.misc.config import CodingRates, Config, RadioParameters, load_config
 
 
-# Fixtures
-@pytest.fixture()
+# Fixtures (session scoped since no test modifies them)
+@pytest.fixture(scope="session")
 def def_radio_params() -> dict[str, str | int | bool]:
     return {
         "modulation": "lora",
@@ -25,29 +25,36 @@ def def_radio_params() -> dict[str, str | int | bool]:
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def callsigns() -> dict[str, str]:
     return {"VA3TEST": "Some Body", "VA3INI": "linguini1"}
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def config(def_radio_params: dict[str, str | int | bool], callsigns: dict[str, str]):
     return {"radio_parameters": def_radio_params, "approved_callsigns": callsigns}
 
 
+@pytest.fixture(scope="session")
+def config_file(config: dict[str, dict[str, str | int | bool]], tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Writes the config to a JSON file in a temporary directory that pytest cleans up."""
+    config_file = tmp_path_factory.mktemp("config") / "test_config.json"
+    config_file.write_text(json.dumps(config))
+    return config_file
+
+
+# Helpers
+def assert_radio_params_match(params: RadioParameters, expected: dict[str, str | int | bool]) -> None:
+    """Asserts that every radio parameter matches the value given for it in a radio parameters JSON object."""
+    expected = dict(expected, sync_word=expected["sync_word"][2:])  # type: ignore
+    assert dict(params) == expected
+
+
 # Test radio parameters
 def test_radio_params_default(def_radio_params: dict[str, str | int | bool]):
     """Tests that the RadioParameters object default constructor initializes all values to the correct defaults."""
     params = RadioParameters()
-    assert params.modulation.value == def_radio_params.get("modulation")
-    assert params.frequency == def_radio_params.get("frequency")
-    assert params.spread_factor == def_radio_params.get("spread_factor")
-    assert params.coding_rate.value == def_radio_params.get("coding_rate")
-    assert params.bandwidth == def_radio_params.get("bandwidth")
-    assert params.preamble_len == def_radio_params.get("preamble_len")
-    assert params.cyclic_redundancy == def_radio_params.get("cyclic_redundancy")
-    assert params.iqi == def_radio_params.get("iqi")
-    assert params.sync_word == def_radio_params.get("sync_word")[2:]  # type: ignore
+    assert_radio_params_match(params, def_radio_params)
 
 
 def test_radio_params_partial_default():
@@ -67,15 +74,7 @@ def test_radio_params_default_json(def_radio_params: dict[str, str | int | bool]
     no radio_params JSON object.
     """
     params = RadioParameters.from_json(dict())
-    assert params.modulation.value == def_radio_params.get("modulation")
-    assert params.frequency == def_radio_params.get("frequency")
-    assert params.spread_factor == def_radio_params.get("spread_factor")
-    assert params.coding_rate.value == def_radio_params.get("coding_rate")
-    assert params.bandwidth == def_radio_params.get("bandwidth")
-    assert params.preamble_len == def_radio_params.get("preamble_len")
-    assert params.cyclic_redundancy == def_radio_params.get("cyclic_redundancy")
-    assert params.iqi == def_radio_params.get("iqi")
-    assert params.sync_word == def_radio_params.get("sync_word")[2:]  # type: ignore
+    assert_radio_params_match(params, def_radio_params)
 
 
 def test_radio_params_partial_defaults_json():
@@ -95,111 +94,73 @@ def test_radio_params_partial_defaults_json():
     assert params.coding_rate == CodingRates.FOUR_FIFTHS
 
 
-def test_radio_params_invalid_arguments():
+# Invalid parameter values shared by the constructor and JSON loading tests
+INVALID_RADIO_PARAMS: list[tuple[str, int | str]] = [
+    ("frequency", 42),
+    ("power", 18),
+    ("spread_factor", 6),
+    ("preamble_len", 65536),
+    ("sync_word", "0x101"),
+]
+
+
+@pytest.mark.parametrize("param, value", INVALID_RADIO_PARAMS)
+def test_radio_params_invalid_arguments(param: str, value: int | str):
     """
     Tests that initializing a RadioParameters object using invalid parameters will raise a value error.
     """
 
     with pytest.raises(ValueError):
-        _ = RadioParameters(frequency=42)
+        _ = RadioParameters(**{param: value})  # type: ignore
 
-    with pytest.raises(ValueError):
-        _ = RadioParameters(power=18)
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(spread_factor=6)
 
-    with pytest.raises(ValueError):
-        _ = RadioParameters(preamble_len=65536)
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(sync_word="0x101")
-
-
-def test_radio_params_invalid_arguments_json():
+@pytest.mark.parametrize("param, value", INVALID_RADIO_PARAMS)
+def test_radio_params_invalid_arguments_json(param: str, value: int | str):
     """
     Tests that initializing a RadioParameters object using invalid parameters from a JSON schema will raise a
     ValueError.
     """
 
     with pytest.raises(ValueError):
-        _ = RadioParameters.from_json({"frequency": 42})
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters.from_json({"power": 18})
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters.from_json({"spread_factor": 6})
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters.from_json({"preamble_len": 65536})
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters.from_json({"sync_word": "0x101"})
+        _ = RadioParameters.from_json({param: value})
 
 
-def test_radio_params_range_edges():
+@pytest.mark.parametrize(
+    "param, low, high",
+    [
+        ("power", -3, 16),
+        ("preamble_len", 0, 65_535),
+        ("frequency", 433_050_000, 434_790_000),
+        ("frequency", 863_000_000, 870_000_000),
+    ],
+)
+def test_radio_params_range_edges(param: str, low: int, high: int):
     """
     Tests that initializing a RadioParameters object with values right at the end of the accepted ranges
-    does not raise any exceptions.
+    does not raise any exceptions, and that values just outside them raise a ValueError.
     """
 
-    _ = RadioParameters(power=-3)
-    _ = RadioParameters(power=16)
+    assert getattr(RadioParameters(**{param: low}), param) == low  # type: ignore
+    assert getattr(RadioParameters(**{param: high}), param) == high  # type: ignore
 
-    _ = RadioParameters(sync_word="0x0")
-    _ = RadioParameters(sync_word="0x100")
-
-    _ = RadioParameters(preamble_len=0)
-    _ = RadioParameters(preamble_len=65_535)
+    with pytest.raises(ValueError):
+        _ = RadioParameters(**{param: low - 1})  # type: ignore
 
-    _ = RadioParameters(frequency=433_050_000)
-    _ = RadioParameters(frequency=434_790_000)
-    _ = RadioParameters(frequency=863_000_000)
-    _ = RadioParameters(frequency=870_000_000)
+    with pytest.raises(ValueError):
+        _ = RadioParameters(**{param: high + 1})  # type: ignore
 
 
-def test_radio_params_outside_range_edges():
+def test_radio_params_sync_word_range_edges():
     """
-    Tests that initializing a RadioParameters object with values just outside the end of the accepted ranges
-    raises a ValueError.
+    Tests that sync words right at the end of the accepted range are accepted, and that one just outside it raises a
+    ValueError.
     """
 
-    with pytest.raises(ValueError):
-        _ = RadioParameters(power=-4)
-    assert RadioParameters(power=-3).power == -3
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(power=17)
-    assert RadioParameters(power=16).power == 16
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(sync_word="0x101")
+    assert RadioParameters(sync_word="0x0").sync_word == "0"
     assert RadioParameters(sync_word="0x100").sync_word == "100"
 
     with pytest.raises(ValueError):
-        _ = RadioParameters(preamble_len=-1)
-    assert RadioParameters(preamble_len=0).preamble_len == 0
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(preamble_len=65_536)
-    assert RadioParameters(preamble_len=65_535).preamble_len == 65_535
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(frequency=433_049_999)
-    assert RadioParameters(frequency=433_050_000).frequency == 433_050_000
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(frequency=434_790_001)
-    assert RadioParameters(frequency=434_790_000).frequency == 434_790_000
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(frequency=862_999_999)
-    assert RadioParameters(frequency=863_000_000).frequency == 863_000_000
-
-    with pytest.raises(ValueError):
-        _ = RadioParameters(frequency=870_000_001)
-    assert RadioParameters(frequency=870_000_000).frequency == 870_000_000
+        _ = RadioParameters(sync_word="0x101")
 
 
 def test_config_defaults(def_radio_params: dict[str, str | int | bool], callsigns: dict[str, str]):
@@ -207,15 +168,7 @@ def test_config_defaults(def_radio_params: dict[str, str | int | bool], callsign
 
     config = Config(approved_callsigns=callsigns)
 
-    assert config.radio_parameters.modulation.value == def_radio_params.get("modulation")
-    assert config.radio_parameters.frequency == def_radio_params.get("frequency")
-    assert config.radio_parameters.spread_factor == def_radio_params.get("spread_factor")
-    assert config.radio_parameters.coding_rate.value == def_radio_params.get("coding_rate")
-    assert config.radio_parameters.bandwidth == def_radio_params.get("bandwidth")
-    assert config.radio_parameters.preamble_len == def_radio_params.get("preamble_len")
-    assert config.radio_parameters.cyclic_redundancy == def_radio_params.get("cyclic_redundancy")
-    assert config.radio_parameters.iqi == def_radio_params.get("iqi")
-    assert config.radio_parameters.sync_word == def_radio_params.get("sync_word")[2:]  # type: ignore
+    assert_radio_params_match(config.radio_parameters, def_radio_params)
     assert config.approved_callsigns == callsigns
 
 
@@ -224,15 +177,7 @@ def test_config_defaults_json(def_radio_params: dict[str, str | int | bool], cal
 
     config = Config.from_json({"approved_callsigns": callsigns})
 
-    assert config.radio_parameters.modulation.value == def_radio_params.get("modulation")
-    assert config.radio_parameters.frequency == def_radio_params.get("frequency")
-    assert config.radio_parameters.spread_factor == def_radio_params.get("spread_factor")
-    assert config.radio_parameters.coding_rate.value == def_radio_params.get("coding_rate")
-    assert config.radio_parameters.bandwidth == def_radio_params.get("bandwidth")
-    assert config.radio_parameters.preamble_len == def_radio_params.get("preamble_len")
-    assert config.radio_parameters.cyclic_redundancy == def_radio_params.get("cyclic_redundancy")
-    assert config.radio_parameters.iqi == def_radio_params.get("iqi")
-    assert config.radio_parameters.sync_word == def_radio_params.get("sync_word")[2:]  # type: ignore
+    assert_radio_params_match(config.radio_parameters, def_radio_params)
     assert config.approved_callsigns == callsigns
 
 
@@ -255,38 +200,13 @@ def test_config_from_json(config: dict[str, dict[str, str | int | bool]]):
 
     cfg = Config.from_json(config)
 
-    rparams = config["radio_parameters"]
-    assert cfg.radio_parameters.modulation.value == rparams.get("modulation")
-    assert cfg.radio_parameters.frequency == rparams.get("frequency")
-    assert cfg.radio_parameters.spread_factor == rparams.get("spread_factor")
-    assert cfg.radio_parameters.coding_rate.value == rparams.get("coding_rate")
-    assert cfg.radio_parameters.bandwidth == rparams.get("bandwidth")
-    assert cfg.radio_parameters.preamble_len == rparams.get("preamble_len")
-    assert cfg.radio_parameters.cyclic_redundancy == rparams.get("cyclic_redundancy")
-    assert cfg.radio_parameters.iqi == rparams.get("iqi")
-    assert cfg.radio_parameters.sync_word == rparams.get("sync_word")[2:]  # type: ignore
+    assert_radio_params_match(cfg.radio_parameters, config["radio_parameters"])
     assert cfg.approved_callsigns == config["approved_callsigns"]
 
 
-def test_load_config(config: dict[str, dict[str, str | int | bool]]):
+def test_load_config(config: dict[str, dict[str, str | int | bool]], config_file: Path):
     """Test that loading a Config object from a valid JSON config file results in the correct values being set."""
 
-    # Setup
-    with open("./test_config.json", "w") as file:
-        json.dump(config, file)
-
-    cfg = load_config("./test_config.json")
-    rparams = config["radio_parameters"]
-    assert cfg.radio_parameters.modulation.value == rparams.get("modulation")
-    assert cfg.radio_parameters.frequency == rparams.get("frequency")
-    assert cfg.radio_parameters.spread_factor == rparams.get("spread_factor")
-    assert cfg.radio_parameters.coding_rate.value == rparams.get("coding_rate")
-    assert cfg.radio_parameters.bandwidth == rparams.get("bandwidth")
-    assert cfg.radio_parameters.preamble_len == rparams.get("preamble_len")
-    assert cfg.radio_parameters.cyclic_redundancy == rparams.get("cyclic_redundancy")
-    assert cfg.radio_parameters.iqi == rparams.get("iqi")
-    assert cfg.radio_parameters.sync_word == rparams.get("sync_word")[2:]  # type: ignore
+    cfg = load_config(str(config_file))
+    assert_radio_params_match(cfg.radio_parameters, config["radio_parameters"])
     assert cfg.approved_callsigns == config["approved_callsigns"]
-
-    # Teardown
-    os.remove("./test_config.json")
@@ -2,21 +2,22 @@
 __author__ = "Matteo Golin"
 
 # Imports
+from typing import Callable
+
 import pytest
 import modules.misc.converter as conv
 
 
 # Tests
-def test_celsius_to_fahrenheit() -> None:
-    """Test that Celsius is properly converted to Fahrenheit."""
-    assert conv.celsius_to_fahrenheit(12.0) == pytest.approx(53.6)  # type: ignore
-
-
-def test_metres_to_feet() -> None:
-    """Test that metres are properly converted to feet."""
-    assert conv.metres_to_feet(5.0) == pytest.approx(16.4)  # type: ignore
-
-
-def test_pascals_to_psi() -> None:
-    """Test that metres are properly converted to feet."""
-    assert conv.pascals_to_psi(87181) == pytest.approx(12.64)  # type: ignore
+@pytest.mark.parametrize(
+    "conversion, value, expected",
+    [
+        (conv.celsius_to_fahrenheit, 12.0, 53.6),
+        (conv.metres_to_feet, 5.0, 16.4),
+        (conv.pascals_to_psi, 87181, 12.64),
+    ],
+    ids=["celsius_to_fahrenheit", "metres_to_feet", "pascals_to_psi"],
+)
+def test_conversion(conversion: Callable[[float], float], value: float, expected: float) -> None:
+    """Test that each unit conversion returns the correctly converted value."""
+    assert conversion(value) == pytest.approx(expected)  # type: ignore
@@ -2,75 +2,92 @@
 __author__ = "Matteo Golin"
 
 # Imports
-import modules.telemetry.status as status
+from pathlib import Path
+from typing import Any
 
+import pytest
+import modules.telemetry.status as status
 
-# Default parameter tests
-def test_serial_data_defaults() -> None:
-    """Test that the default field values for the serial data are correct."""
-    serial_data = status.SerialData()
 
-    assert serial_data.available_ports == []
+# Fixtures
+@pytest.fixture
+def serial_data() -> status.SerialData:
+    return status.SerialData(available_ports=["20", "16"])
 
 
-def test_rn2483_radio_data_defaults() -> None:
-    """Test that the default field values for the RN2483 radio data are correct."""
-    radio_data = status.RN2483RadioData()
+@pytest.fixture
+def rn2483_radio_data() -> status.RN2483RadioData:
+    return status.RN2483RadioData(connected=True, connected_port="20", snr=5)
 
-    assert radio_data.connected is False
-    assert radio_data.connected_port == ""
 
+@pytest.fixture
+def mission_data() -> status.MissionData:
+    return status.MissionData(
+        name="rocket mission",
+        epoch=12,
+        state=status.MissionState.RECORDED,
+        recording=True,
+        last_mission_time=3921,
+    )
 
-def test_mission_data_defaults() -> None:
-    """Test that the default field values for the mission data are correct."""
-    mission_data = status.MissionData()
 
-    assert mission_data.name == ""
-    assert mission_data.epoch == -1
-    assert mission_data.state == status.MissionState.DNE
-    assert mission_data.recording is False
-    assert mission_data.last_mission_time == -1
+@pytest.fixture
+def replay_data() -> status.ReplayData:
+    replay_data = status.ReplayData(
+        state=status.ReplayState.PAUSED,
+        speed=2.5,
+    )
 
+    # Mission list must be reset so that it can be tested without knowing what is
+    # in the missions directory
+    replay_data.mission_list = [status.MissionEntry(name="TestData", length=3598549)]
+    return replay_data
 
-def test_replay_data_defaults() -> None:
-    """Test that the default field values for the replay data are correct."""
-    replay_data = status.ReplayData()
 
-    assert replay_data.state == status.ReplayState.DNE
-    assert replay_data.speed == 1.0
+# Default parameter tests
+@pytest.mark.parametrize(
+    "data_class, defaults",
+    [
+        (status.SerialData, {"available_ports": []}),
+        (status.RN2483RadioData, {"connected": False, "connected_port": "", "snr": 0}),
+        (
+            status.MissionData,
+            {
+                "name": "",
+                "epoch": -1,
+                "state": status.MissionState.DNE,
+                "recording": False,
+                "last_mission_time": -1,
+            },
+        ),
+        (status.ReplayData, {"state": status.ReplayState.DNE, "speed": 1.0}),
+    ],
+    ids=["serial_data", "rn2483_radio_data", "mission_data", "replay_data"],
+)
+def test_data_defaults(data_class: type, defaults: dict[str, Any]) -> None:
+    """Test that the default field values for each status data packet are correct."""
+    data = data_class()
+
+    assert {field: getattr(data, field) for field in defaults} == defaults
 
 
 # JSON serialization tests
-def test_serial_data_serialization() -> None:
+def test_serial_data_serialization(serial_data: status.SerialData) -> None:
     """Test that the serialization of serial data is correct."""
-    serial_data = status.SerialData(available_ports=["20", "16"])
-
     assert dict(serial_data) == {"available_ports": ["20", "16"]}
 
 
-def test_rn2483_radio_data_serialization() -> None:
+def test_rn2483_radio_data_serialization(rn2483_radio_data: status.RN2483RadioData) -> None:
     """Test that the serialization of RN2483 radio data is correct."""
-
-    rn2483_radio_data = status.RN2483RadioData(connected=True, connected_port="20")
-
     assert dict(rn2483_radio_data) == {
         "connected_port": "20",
         "connected": True,
-        "snr": 0,
+        "snr": 5,
     }
 
 
-def test_mission_data_serialization() -> None:
+def test_mission_data_serialization(mission_data: status.MissionData) -> None:
     """Test that the serialization of mission data is correct."""
-
-    mission_data = status.MissionData(
-        name="rocket mission",
-        epoch=12,
-        state=status.MissionState.RECORDED,
-        recording=True,
-        last_mission_time=50,
-    )
-
     assert dict(mission_data) == {
         "name": "rocket mission",
         "epoch": 12,
@@ -79,34 +96,14 @@ def test_mission_data_serialization() -> None:
     }
 
 
-def test_status_data_serialization() -> None:
+def test_status_data_serialization(
+    mission_data: status.MissionData,
+    serial_data: status.SerialData,
+    rn2483_radio_data: status.RN2483RadioData,
+    replay_data: status.ReplayData,
+) -> None:
     """Test that the serialization of status data is correct."""
 
-    mission_data = status.MissionData(
-        name="rocket mission",
-        epoch=12,
-        state=status.MissionState.RECORDED,
-        recording=True,
-        last_mission_time=3921,
-    )
-
-    serial_data = status.SerialData(available_ports=["20", "16"])
-
-    rn2483_radio_data = status.RN2483RadioData(
-        connected=True,
-        connected_port="20",
-        snr=5,
-    )
-
-    replay_data = status.ReplayData(
-        state=status.ReplayState.PAUSED,
-        speed=2.5,
-    )
-
-    # Mission list must be reset so that it can be tested without knowing what is
-    # in the missions directory
-    replay_data.mission_list = [status.MissionEntry(name="TestData", length=3598549)]
-
     status_data = status.TelemetryStatus(
         mission=mission_data,
         serial=serial_data,
@@ -133,3 +130,20 @@ def test_status_data_serialization() -> None:
             "mission_list": [{"name": "TestData", "length": 3598549, "version": 1}],
         },
     }
+
+
+# Mission list tests
+def test_mission_length_refreshed_when_file_changes(tmp_path: Path) -> None:
+    """Test that a mission's cached length is recounted once the mission file has been appended to."""
+    mission_file = tmp_path / f"test.{status.MISSION_EXTENSION}"
+    mission_file.write_text("a\nb\n")
+
+    replay_data = status.ReplayData()
+    replay_data.update_mission_list(missions_dir=tmp_path)
+    assert replay_data.mission_list[0].length == 2
+
+    with open(mission_file, "a") as file:
+        file.write("c\n")
+
+    replay_data.update_mission_list(missions_dir=tmp_path)
+    assert replay_data.mission_list[0].length == 3
@@ -0,0 +1,56 @@
+# Test the RN2483 radio wrapper
+
+# Imports
+import pytest
+from modules.serial.rn2483_radio import RN2483Radio
+
+
+# Helper classes
+class FakeSerial:
+    """Serial connection stand-in that replays canned lines from the radio."""
+
+    def __init__(self, lines: list[bytes]):
+        self.lines: list[bytes] = lines
+        self.written: list[bytes] = []
+
+    def readline(self) -> bytes:
+        return self.lines.pop(0)
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def make_radio(reception: bytes) -> RN2483Radio:
+    """Creates a radio whose serial connection accepts receive mode and then returns the given reception."""
+
+    radio = RN2483Radio.__new__(RN2483Radio)  # Skip opening a real serial port
+    radio.serial = FakeSerial([b"ok\r\n", b"ok\r\n", reception])  # type: ignore
+    return radio
+
+
+# Tests
+@pytest.mark.parametrize(
+    "reception",
+    [
+        b"radio_rx  564133494E49\r\n",
+        b"radio_rx 564133494E49\r\n",
+    ],
+)
+def test_receive_valid_message(reception: bytes) -> None:
+    """Test that a hex message is returned without the reception indicator or its padding."""
+    assert make_radio(reception).receive() == "564133494E49"
+
+
+@pytest.mark.parametrize(
+    "reception",
+    [
+        b"radio_rx  56413349ZZ49\r\n",
+        b"radio_err\r\n",
+    ],
+)
+def test_receive_invalid_message(reception: bytes) -> None:
+    """Test that receptions which are not hex are discarded."""
+    assert make_radio(reception).receive() is None
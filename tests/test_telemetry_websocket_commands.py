@@ -50,11 +50,11 @@ def test_command_not_found_error_message() -> None:
     command = "replay halt"
     parameters = cmd.split_command_string(command)
 
-    try:
+    with pytest.raises(cmd.WebsocketCommandNotFound) as error:
         _ = cmd.parse(parameters, cmd.WebsocketCommand)
-    except cmd.WebsocketCommandNotFound as error:
-        assert error.command == "halt"
-        assert error.message == "The websocket command 'halt' does not exist."
+
+    assert error.value.command == "halt"
+    assert error.value.message == "The websocket command 'halt' does not exist."
 
 
 def test_parse_default_enum() -> None: